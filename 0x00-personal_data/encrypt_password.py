@@ -3,20 +3,28 @@
 encrypt_password.py
 """
 
-import bcrypt
+import os
+
+import bcrypt  # bcrypt>=4 is the Rust/PyO3 implementation
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 
 def hash_password(password: str) -> bytes:
     """
     Hashes a password using bcrypt and returns the hashed password as bytes.
 
+    The cost factor is read from the BCRYPT_ROUNDS environment variable
+    (default 10); higher values are slower but harder to brute force.
+
     Args:
         password (str): The plain text password to hash.
 
     Returns:
         bytes: The salted, hashed password.
     """
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode(), salt)
 
 
 def is_valid(hashed_password: bytes, password: str) -> bool:
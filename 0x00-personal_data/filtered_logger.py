@@ -3,27 +3,40 @@
 filtered_logger.py
 """
 
+import functools
+import itertools
 import logging
 import re
 import os
 import mysql.connector
-from typing import List
+from typing import List, Pattern, Tuple
 from mysql.connector.connection import MySQLConnection
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_pattern(fields: Tuple[str, ...], separator: str) -> Pattern:
+    """Compiles one alternation pattern matching any field and its value"""
+    sep = re.escape(separator)
+    # keys must not follow a word character, so "name" skips "username=";
+    # values stop at end of line
+    return re.compile(
+        f"(?<!\\w)({'|'.join(map(re.escape, fields))})"
+        f"=[^{sep}\\n]*"
+    )
+
+
 def filter_datum(fields: List[str], redaction: str, message: str,
                  separator: str) -> str:
     """Returns the log message obfuscated with redaction for PII fields"""
-    for field in fields:
-        message = re.sub(
-            f"{field}=.*?{separator}",
-            f"{field}={redaction}{separator}",
-            message
-        )
-    return message
+    return _compile_pattern(tuple(fields), separator).sub(
+        rf"\1={redaction}", message
+    )
 
 
 PII_FIELDS = ("name", "email", "phone", "ssn", "password")
+USER_FIELDS = PII_FIELDS + ("ip", "last_login", "user_agent")
+FETCH_SIZE = 1000
+LOG_BATCH_SIZE = 100
 
 
 class RedactingFormatter(logging.Formatter):
@@ -36,14 +49,17 @@ class RedactingFormatter(logging.Formatter):
     def __init__(self, fields: List[str]):
         super(RedactingFormatter, self).__init__(self.FORMAT)
         self.fields = fields
+        # compiled once per (fields, separator), shared across formatters
+        self._pattern = _compile_pattern(tuple(fields), self.SEPARATOR)
+        self._sub = self._pattern.sub
+        self._replacement = rf"\1={self.REDACTION}"
 
     def format(self, record: logging.LogRecord) -> str:
-        record.msg = filter_datum(
-            self.fields,
-            self.REDACTION,
-            record.getMessage(),
-            self.SEPARATOR
-        )
+        message = record.getMessage()
+        if "=" in message:  # no key=value pairs means nothing to redact
+            message = self._sub(self._replacement, message)
+        record.msg = message
+        record.args = None  # msg is already resolved against its args
         return super().format(record)
 
 
@@ -72,16 +88,24 @@ def get_db() -> MySQLConnection:
 
 def main() -> None:
     """Main function that fetches user data and logs it with redaction"""
-    db = get_db()
-    cursor = db.cursor()
-    cursor.execute("SELECT * FROM users;")
     logger = get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    fields = [i[0] for i in cursor.description]  # column names
-
-    for row in cursor:
-        record = "; ".join(f"{field}={value}" for field, value in zip(fields, row)) + ";"
-        logger.info(record)
+    db = get_db()
+    cursor = db.cursor(buffered=False)  # stream rows from the server
+    cursor.execute(f"SELECT {', '.join(USER_FIELDS)} FROM users;")
+
+    # formatting is deferred to the handler
+    fmt = "; ".join(f"{field}=%s" for field in USER_FIELDS) + ";"
+    rows = cursor.fetchmany(FETCH_SIZE)
+    while rows:
+        # one multi-line record per batch of rows
+        for i in range(0, len(rows), LOG_BATCH_SIZE):
+            batch = rows[i:i + LOG_BATCH_SIZE]
+            logger.info("\n".join([fmt] * len(batch)),
+                        *itertools.chain.from_iterable(batch))
+        rows = cursor.fetchmany(FETCH_SIZE)
 
     cursor.close()
     db.close()
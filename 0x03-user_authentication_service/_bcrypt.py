@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""
+bcrypt backend shim.
+Requires bcrypt>=4, which is implemented in Rust via PyO3.
+"""
+from bcrypt import checkpw, gensalt, hashpw
+
+__all__ = ["checkpw", "gensalt", "hashpw"]
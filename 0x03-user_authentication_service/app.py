@@ -4,13 +4,22 @@ Flask application for user authentication service.
 Provides endpoints for user registration, login, logout,
 profile access, and password reset functionality.
 """
-from flask import Flask, jsonify, request, abort, redirect
+from flask import Flask, Response, jsonify, request, abort, redirect
 from auth import Auth
 
 
 app = Flask(__name__)
 AUTH = Auth()
 
+# the welcome payload never changes, so serialize it once
+_WELCOME_BODY = b'{"message":"Bienvenue"}\n'
+
+
+@app.teardown_appcontext
+def shutdown_session(exception=None) -> None:
+    """Release the request thread's database session."""
+    AUTH._db._session_factory.remove()
+
 
 @app.route('/', methods=['GET'], strict_slashes=False)
 def welcome() -> str:
@@ -19,7 +28,7 @@ def welcome() -> str:
     Returns:
         A JSON payload with a welcome message.
     """
-    return jsonify({"message": "Bienvenue"})
+    return Response(_WELCOME_BODY, mimetype="application/json")
 
 
 @app.route('/users', methods=['POST'], strict_slashes=False)
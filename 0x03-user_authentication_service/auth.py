@@ -3,15 +3,88 @@
 Authentication module that provides methods for user authentication,
 registration, session management, and password reset functionality.
 """
-import bcrypt
+import asyncio
+import os
+import queue
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+import _bcrypt
 from db import DB
 from user import User
+from sqlalchemy.engine import Row
 from sqlalchemy.orm.exc import NoResultFound
 
+# bcrypt work runs on this pool, capping concurrent hashes at cpu_count.
+# Sync callers still block on .result() for the whole hash.
+EXECUTOR: ThreadPoolExecutor = None
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+
+_SALT_POOL: "queue.Queue[bytes]" = None
+
+
+def _fill_salt_pool(pool: "queue.Queue[bytes]") -> None:
+    """Keep the salt pool topped up; blocks while the pool is full."""
+    while True:
+        pool.put(_bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+
+
+def _start_executor() -> None:
+    """Create a fresh executor for bcrypt work.
+
+    Also runs in forked children: worker threads are not copied by fork,
+    so an inherited executor would never run submitted work.
+    """
+    global EXECUTOR
+    EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def _start_salt_pool() -> None:
+    """Create a fresh salt pool and start its background filler thread.
+
+    Also runs in forked children, so they never reuse the parent's salts.
+    """
+    global _SALT_POOL
+    _SALT_POOL = queue.Queue(maxsize=64)
+    threading.Thread(target=_fill_salt_pool, args=(_SALT_POOL,),
+                     daemon=True).start()
+
+
+_start_executor()
+_start_salt_pool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_start_executor)
+    os.register_at_fork(after_in_child=_start_salt_pool)
 
-def _hash_password(password: str) -> bytes:
+
+def _encode_password(password: Union[str, bytes]) -> bytes:
+    """Encode a password for bcrypt, passing bytes through unchanged.
+
+    ASCII-only passwords take the cheaper latin-1 codec, which gives the
+    same bytes as UTF-8 for ASCII input.
+
+    Args:
+        password: The password as str or already-encoded bytes.
+
+    Returns:
+        The password as bytes.
+    """
+    if isinstance(password, bytes):
+        return password
+    if password.isascii():
+        return password.encode('latin-1')
+    return password.encode('utf-8')
+
+
+def _hash_password(password: Union[str, bytes]) -> bytes:
     """Hash a password using bcrypt with salt.
+
+    The cost factor comes from BCRYPT_ROUNDS (default 10). Each extra
+    round doubles hashing time; raise it for production deployments.
+    Verification is unaffected since the cost is stored in the hash.
     
     Args:
         password: The password to hash.
@@ -19,9 +92,27 @@ def _hash_password(password: str) -> bytes:
     Returns:
         The salted hash of the password as bytes.
     """
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed
+    try:
+        salt = _SALT_POOL.get_nowait()
+    except queue.Empty:
+        salt = _bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return EXECUTOR.submit(_bcrypt.hashpw,
+                           _encode_password(password), salt).result()
+
+
+def _check_password(password: Union[str, bytes],
+                    hashed_password: bytes) -> bool:
+    """Check a password against a bcrypt hash on the executor.
+
+    Args:
+        password: The plain text password.
+        hashed_password: The stored bcrypt hash.
+
+    Returns:
+        True if the password matches the hash, False otherwise.
+    """
+    return EXECUTOR.submit(_bcrypt.checkpw, _encode_password(password),
+                           hashed_password).result()
 
 
 def _generate_uuid() -> str:
@@ -57,13 +148,10 @@ class Auth:
         Raises:
             ValueError: If a user with the given email already exists.
         """
-        try:
-            self._db.find_user_by(email=email)
+        if self._db.user_exists(email=email):
             raise ValueError(f"User {email} already exists")
-        except NoResultFound:
-            hashed_password = _hash_password(password)
-            user = self._db.add_user(email, hashed_password)
-            return user
+        hashed_password = _hash_password(password)
+        return self._db.add_user(email, hashed_password)
 
     def valid_login(self, email: str, password: str) -> bool:
         """Validate user login credentials.
@@ -76,10 +164,45 @@ class Auth:
             True if the credentials are valid, False otherwise.
         """
         try:
-            user = self._db.find_user_by(email=email)
-            return bcrypt.checkpw(password.encode('utf-8'), user.hashed_password)
+            hashed_password, = self._db.find_columns_by(
+                (User.hashed_password,), email=email)
+            return _check_password(password, hashed_password)
+        except NoResultFound:
+            return False
+
+    async def valid_login_async(self, email: str, password: str) -> bool:
+        """Validate user login credentials without blocking the event loop.
+
+        Args:
+            email: The email of the user.
+            password: The password to validate.
+
+        Returns:
+            True if the credentials are valid, False otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(EXECUTOR, self._valid_login_on_pool,
+                                          email, password)
+
+    def _valid_login_on_pool(self, email: str, password: str) -> bool:
+        """Look up and check credentials from an executor worker thread.
+
+        Args:
+            email: The email of the user.
+            password: The password to validate.
+
+        Returns:
+            True if the credentials are valid, False otherwise.
+        """
+        try:
+            hashed_password, = self._db.find_columns_by(
+                (User.hashed_password,), email=email)
         except NoResultFound:
             return False
+        finally:
+            self._db.close_session()
+        # already on EXECUTOR; resubmitting could deadlock a full pool
+        return _bcrypt.checkpw(_encode_password(password), hashed_password)
 
     def create_session(self, email: str) -> str:
         """Create a new session for a user.
@@ -98,21 +221,22 @@ class Auth:
         except NoResultFound:
             return None
 
-    def get_user_from_session_id(self, session_id: str) -> User:
+    def get_user_from_session_id(self, session_id: str) -> Optional[Row]:
         """Get user from session ID.
         
         Args:
             session_id: The session ID to look up.
         
         Returns:
-            The corresponding User object if found, None otherwise.
+            A Row with only the user's id and email (not a User) if
+            found, None otherwise.
         """
         if session_id is None:
             return None
         
         try:
-            user = self._db.find_user_by(session_id=session_id)
-            return user
+            return self._db.find_columns_by((User.id, User.email),
+                                            session_id=session_id)
         except NoResultFound:
             return None
 
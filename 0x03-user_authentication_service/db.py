@@ -2,35 +2,53 @@
 """
 DB module
 """
+import os
+from typing import Tuple
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import InvalidRequestError
 
 from user import Base, User
 
+_USER_COLUMNS = frozenset(User.__table__.columns.keys())
+
 
 class DB:
     """DB class"""
 
+    # shared by every DB instance so the schema is set up once per process
+    _engine = None
+    _session_factory = None
+
     def __init__(self) -> None:
         """Initialize a new DB instance"""
-        self._engine = create_engine("sqlite:///a.db", echo=True)
-        Base.metadata.drop_all(self._engine)
-        Base.metadata.create_all(self._engine)
-        self.__session = None
+        if DB._engine is None:
+            DB._engine = create_engine(
+                os.getenv("DB_URL", "sqlite:///a.db"), echo=False)
+            # one session per thread; call remove() when a request ends
+            DB._session_factory = scoped_session(
+                sessionmaker(bind=DB._engine))
+            if os.getenv("DB_RESET"):
+                Base.metadata.drop_all(DB._engine)
+            Base.metadata.create_all(DB._engine)
+            # create_all skips existing tables, so add missing indexes
+            for index in User.__table__.indexes:
+                index.create(DB._engine, checkfirst=True)
 
     @property
     def _session(self) -> Session:
-        """Memoized session object"""
-        if self.__session is None:
-            DBSession = sessionmaker(bind=self._engine)
-            self.__session = DBSession()
-        return self.__session
+        """Session object for the current thread"""
+        return DB._session_factory()
 
-    def add_user(self, email: str, hashed_password: str) -> User:
+    def close_session(self) -> None:
+        """Release the current thread's session"""
+        DB._session_factory.remove()
+
+    def add_user(self, email: str, hashed_password: bytes) -> User:
         """
         Adds a new user to the database and returns the User object.
         """
@@ -58,18 +76,58 @@ class DB:
         except InvalidRequestError:
             raise InvalidRequestError("Invalid query arguments")
 
+    def user_exists(self, **kwargs) -> bool:
+        """
+        Check whether any user matches the given criteria.
+
+        Raises:
+            InvalidRequestError: If query arguments are invalid.
+        """
+        if not kwargs:
+            raise InvalidRequestError("No attributes to filter by")
+
+        try:
+            query = self._session.query(User).filter_by(**kwargs)
+            return self._session.query(query.exists()).scalar()
+        except InvalidRequestError:
+            raise InvalidRequestError("Invalid query arguments")
+
+    def find_columns_by(self, columns: Tuple, **kwargs) -> Tuple:
+        """
+        Find the given columns of the first user matching the criteria.
+
+        Raises:
+            NoResultFound: If no user is found.
+            InvalidRequestError: If query arguments are invalid.
+        """
+        if not kwargs:
+            raise InvalidRequestError("No attributes to filter by")
+
+        try:
+            return self._session.query(*columns).filter_by(**kwargs).one()
+        except NoResultFound:
+            raise NoResultFound("No user found with given attributes")
+        except InvalidRequestError:
+            raise InvalidRequestError("Invalid query arguments")
+
     def update_user(self, user_id: int, **kwargs) -> None:
         """
         Update attributes of the user found by user_id.
 
         Raises:
             ValueError: If any key in kwargs is not an attribute of User.
+            NoResultFound: If no user has the given id.
         """
-        user = self.find_user_by(id=user_id)
-
-        for key, value in kwargs.items():
-            if not hasattr(user, key):
+        for key in kwargs:
+            if key not in _USER_COLUMNS:
                 raise ValueError(f"{key} is not a valid attribute of User")
-            setattr(user, key, value)
+        if not kwargs:
+            return
+
+        updated = self._session.query(User).filter_by(id=user_id).update(
+            kwargs, synchronize_session=False)
+        if not updated:
+            self._session.rollback()
+            raise NoResultFound("No user found with given attributes")
 
         self._session.commit()
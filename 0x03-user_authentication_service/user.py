@@ -4,7 +4,7 @@ SQLAlchemy model for a User table.
 """
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, LargeBinary, String
 
 Base = declarative_base()
 
@@ -16,7 +16,7 @@ class User(Base):
     __tablename__ = 'users'
 
     id: int = Column(Integer, primary_key=True)
-    email: str = Column(String(250), nullable=False)
-    hashed_password: str = Column(String(250), nullable=False)
-    session_id: str = Column(String(250), nullable=True)
-    reset_token: str = Column(String(250), nullable=True)
+    email: str = Column(String(250), nullable=False, unique=True, index=True)
+    hashed_password: bytes = Column(LargeBinary(60), nullable=False)
+    session_id: str = Column(String(36), nullable=True, index=True)
+    reset_token: str = Column(String(36), nullable=True, index=True)